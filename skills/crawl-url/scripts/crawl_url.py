@@ -7,6 +7,8 @@ as a separate markdown file in a flat directory structure.
 """
 
 import argparse
+import asyncio
+import hashlib
 import os
 import re
 from datetime import datetime
@@ -14,7 +16,7 @@ from pathlib import Path
 from urllib.parse import urlparse
 
 try:
-    from tavily import TavilyClient
+    from tavily import AsyncTavilyClient
 except ImportError:
     print("Error: tavily-python not installed. Run: pip install tavily-python")
     exit(1)
@@ -31,6 +33,28 @@ SCRIPT_DIR = Path(__file__).parent
 REPO_ROOT = SCRIPT_DIR.parents[3]
 CRAWLED_CONTEXT_DIR = REPO_ROOT / "crawled_context"
 
+# Max pages written to disk at once (bounds open file descriptors)
+MAX_CONCURRENT_WRITES = 16
+
+# Max seed crawls running at once when crawling from a seed list
+MAX_CONCURRENT_CRAWLS = 4
+
+# Print save progress every N pages rather than once per file
+PROGRESS_INTERVAL = 10
+
+# Filename stems longer than this are truncated and suffixed with a URL hash
+MAX_FILENAME_LENGTH = 190
+TRUNCATED_PREFIX_LENGTH = 180
+
+# Precompiled helpers for url_to_filename
+_PROTO_RE = re.compile(r'^https?://')
+_UNSAFE_RE = re.compile(r'[^\w\-]')
+_UNDERSCORE_RE = re.compile(r'_+')
+# Maps every ASCII character outside [\w-] to an underscore
+_SAFE_TABLE = {
+    c: '_' for c in range(128) if not (chr(c).isalnum() or chr(c) in '_-')
+}
+
 
 def url_to_filename(url: str) -> str:
     """
@@ -40,45 +64,181 @@ def url_to_filename(url: str) -> str:
         https://docs.example.com/api/users -> docs_example_com_api_users.md
     """
     # Remove protocol
-    url_clean = re.sub(r'^https?://', '', url)
+    url_clean = _PROTO_RE.sub('', url)
 
     # Remove trailing slash
     url_clean = url_clean.rstrip('/')
 
     # Replace special characters with underscores
-    url_clean = re.sub(r'[^\w\-]', '_', url_clean)
+    url_clean = url_clean.translate(_SAFE_TABLE)
+    if not url_clean.isascii():
+        url_clean = _UNSAFE_RE.sub('_', url_clean)
+
+    # Remove duplicate underscores (the substring check skips the regex
+    # engine entirely for the common case of nothing to collapse)
+    if '__' in url_clean:
+        url_clean = _UNDERSCORE_RE.sub('_', url_clean)
+
+    # Limit length to avoid filesystem issues; the hash suffix keeps long
+    # URLs sharing a prefix from overwriting each other
+    if len(url_clean) > MAX_FILENAME_LENGTH:
+        digest = hashlib.blake2b(url.encode('utf-8'), digest_size=6).hexdigest()
+        # Strip a trailing underscore so the separator doesn't double it
+        url_clean = f"{url_clean[:TRUNCATED_PREFIX_LENGTH].rstrip('_')}_{digest}"
 
-    # Remove duplicate underscores
-    url_clean = re.sub(r'_+', '_', url_clean)
+    return f"{url_clean}.md"
 
-    # Limit length to avoid filesystem issues
-    if len(url_clean) > 200:
-        url_clean = url_clean[:200]
 
-    return f"{url_clean}.md"
+def _canonicalize_url(url: str) -> tuple:
+    """
+    Reduce a URL to a key that treats trivially different forms as equal
+    (host case, trailing slash, fragment).
+    """
+    parsed = urlparse(url)
+    return (parsed.scheme, parsed.netloc.lower(), parsed.path.rstrip('/'), parsed.query)
 
 
-def crawl_and_save(
+def _pick_longer_content(current: dict, candidate: dict) -> dict:
+    """Return whichever page has the longer raw_content."""
+    if len(candidate.get("raw_content") or "") > len(current.get("raw_content") or ""):
+        return candidate
+    return current
+
+
+def dedupe_pages(results: list) -> list:
+    """
+    Deduplicate crawled pages by canonical URL, keeping the page with the
+    most content for each URL. Preserves first-seen order.
+    """
+    seen = {}
+    for page in results:
+        key = _canonicalize_url(page.get("url", ""))
+        if key in seen:
+            seen[key] = _pick_longer_content(seen[key], page)
+        else:
+            seen[key] = page
+    return list(seen.values())
+
+
+async def _crawl_many(client, urls: list, crawl_params: dict) -> list:
+    """
+    Crawl several start URLs concurrently and return all pages found.
+
+    crawl_params holds every crawl setting except the start URL. A failing
+    seed is reported and skipped so the other crawls are not lost; the
+    error is only raised if every seed fails.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CRAWLS)
+
+    async def crawl_one(seed):
+        async with semaphore:
+            response = await client.crawl(url=seed, **crawl_params)
+        return response.get("results", [])
+
+    results_lists = await asyncio.gather(
+        *[crawl_one(seed) for seed in urls], return_exceptions=True
+    )
+
+    pages = []
+    errors = []
+    for seed, results in zip(urls, results_lists):
+        if isinstance(results, Exception):
+            print(f"❌ Crawl failed for {seed}: {results}")
+            errors.append(results)
+        else:
+            pages.extend(results)
+
+    if errors and len(errors) == len(urls):
+        raise errors[0]
+    return pages
+
+
+def _saved_content_hash(filepath: Path) -> str:
+    """
+    Return the content_hash recorded in an existing file's front-matter,
+    or None if the file is missing or has no hash.
+    """
+    try:
+        with open(filepath, 'rb') as f:
+            if f.readline() != b'---\n':
+                return None
+            for line in f:
+                if line == b'---\n':
+                    break
+                if line.startswith(b'content_hash: '):
+                    return line[len(b'content_hash: '):].strip().decode('ascii')
+    except OSError:
+        pass
+    return None
+
+
+def _write_page(output_dir: Path, page: dict, header_template: str) -> tuple:
+    """
+    Write a single crawled page as a markdown file, unless the existing
+    file already holds the same content.
+
+    header_template is the metadata front-matter with {url} and
+    {content_hash} placeholders.
+
+    Returns:
+        (filename, written) where written is False if the page was unchanged
+    """
+    page_url = page.get("url", "")
+    content = page.get("raw_content", "")
+
+    # Generate filename from URL
+    filename = url_to_filename(page_url)
+    filepath = output_dir / filename
+
+    # Skip pages whose content matches what a previous crawl saved
+    content_bytes = content.encode('utf-8')
+    content_hash = hashlib.blake2b(content_bytes, digest_size=8).hexdigest()
+    if _saved_content_hash(filepath) == content_hash:
+        return filename, False
+
+    # Add metadata header to markdown file
+    header = header_template.format(url=page_url, content_hash=content_hash)
+
+    # Save file as pre-encoded bytes, writing header and body separately so
+    # the (possibly large) content is never copied into a combined string
+    with open(filepath, 'wb') as f:
+        f.write(header.encode('utf-8'))
+        f.write(content_bytes)
+        f.write(b'\n')
+
+    return filename, True
+
+
+async def crawl_and_save_async(
     url: str,
     output_dir: Path,
     instruction: str = None,
     max_depth: int = 2,
     max_breadth: int = 50,
     limit: int = 50,
+    seeds: list = None,
 ) -> dict:
     """
     Crawl a site and save each page as a markdown file.
 
+    With seeds, each seed URL (plus url, if given) is crawled concurrently
+    and the results are merged and deduplicated.
+
     Returns:
-        dict with 'pages_saved', 'output_dir', and 'crawled_at'
+        dict with 'pages_saved', 'pages_unchanged', 'output_dir', and 'crawled_at'
     """
     api_key = os.environ.get("TAVILY_API_KEY")
     if not api_key:
         raise ValueError("TAVILY_API_KEY environment variable not set")
 
-    client = TavilyClient(api_key=api_key)
+    start_urls = list(dict.fromkeys(([url] if url else []) + list(seeds or [])))
+    if not start_urls:
+        raise ValueError("No URL or seeds to crawl")
 
-    print(f"🔍 Crawling: {url}")
+    if len(start_urls) == 1:
+        print(f"🔍 Crawling: {start_urls[0]}")
+    else:
+        print(f"🔍 Crawling {len(start_urls)} seeds: {', '.join(start_urls)}")
     if instruction:
         print(f"📋 Instruction: {instruction}")
     print(f"⚙️  Settings: depth={max_depth}, breadth={max_breadth}, limit={limit}")
@@ -86,7 +246,6 @@ def crawl_and_save(
 
     # Build crawl parameters
     crawl_params = {
-        "url": url,
         "max_depth": max_depth,
         "max_breadth": max_breadth,
         "limit": limit,
@@ -99,55 +258,102 @@ def crawl_and_save(
 
     # Execute crawl
     print("⏳ Crawling (this may take a minute)...")
-    response = client.crawl(**crawl_params)
-
-    results = response.get("results", [])
+    # The client owns an httpx connection pool; close it once crawling is done
+    async with AsyncTavilyClient(api_key=api_key) as client:
+        results = await _crawl_many(client, start_urls, crawl_params)
     print(f"✅ Found {len(results)} pages\n")
 
+    # Drop duplicate URLs before touching the disk
+    unique_results = dedupe_pages(results)
+    if len(unique_results) < len(results):
+        print(f"🔁 Dropped {len(results) - len(unique_results)} duplicate pages\n")
+    results = unique_results
+
     # Create output directory
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Save each page as a markdown file
     print(f"💾 Saving to: {output_dir}\n")
-    saved_count = 0
-
-    for idx, page in enumerate(results, 1):
+    # Key pages by output filename: distinct URLs can map to the same file,
+    # and concurrent writes to one path would interleave. The last page wins,
+    # as it would with sequential writes.
+    pages_by_filename = {}
+    for page in results:
         page_url = page.get("url", "")
-        content = page.get("raw_content", "")
-
-        if not content:
+        if not page.get("raw_content"):
             print(f"⚠️  Skipping {page_url} (no content)")
             continue
-
-        # Generate filename from URL
         filename = url_to_filename(page_url)
-        filepath = output_dir / filename
-
-        # Add metadata header to markdown file
-        markdown_output = f"""---
-source_url: {page_url}
-crawled_at: {datetime.now().isoformat()}
----
+        if filename in pages_by_filename:
+            replaced_url = pages_by_filename[filename].get("url", "")
+            print(f"⚠️  {page_url} overwrites {replaced_url} (same filename {filename})")
+        pages_by_filename[filename] = page
+    pages = list(pages_by_filename.values())
+
+    # One timestamp for the whole crawl, shared by every file header
+    crawled_at = datetime.now().isoformat()
+    header_template = (
+        f"---\nsource_url: {{url}}\ncrawled_at: {crawled_at}\n"
+        f"content_hash: {{content_hash}}\n---\n\n"
+    )
 
-{content}
-"""
+    # Write files concurrently; each write runs in a worker thread
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_WRITES)
 
-        # Save file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(markdown_output)
+    async def write(page):
+        async with semaphore:
+            return await asyncio.to_thread(
+                _write_page, output_dir, page, header_template
+            )
 
-        print(f"  [{idx}/{len(results)}] {filename}")
-        saved_count += 1
+    saved_count = 0
+    unchanged_count = 0
+    for idx, next_write in enumerate(
+        asyncio.as_completed([write(page) for page in pages]), 1
+    ):
+        _, written = await next_write
+        if written:
+            saved_count += 1
+        else:
+            unchanged_count += 1
+        if idx % PROGRESS_INTERVAL == 0 or idx == len(pages):
+            print(f"  [{idx}/{len(pages)}] {saved_count} saved, {unchanged_count} unchanged")
 
     print(f"\n✅ Saved {saved_count} markdown files to {output_dir}")
+    if unchanged_count:
+        print(f"⏭️  Skipped {unchanged_count} unchanged files")
 
     return {
         "pages_saved": saved_count,
+        "pages_unchanged": unchanged_count,
         "output_dir": str(output_dir),
-        "crawled_at": datetime.now().isoformat(),
+        "crawled_at": crawled_at,
     }
 
 
+def crawl_and_save(
+    url: str,
+    output_dir: Path,
+    instruction: str = None,
+    max_depth: int = 2,
+    max_breadth: int = 50,
+    limit: int = 50,
+    seeds: list = None,
+) -> dict:
+    """
+    Synchronous wrapper around crawl_and_save_async.
+    """
+    return asyncio.run(crawl_and_save_async(
+        url=url,
+        output_dir=output_dir,
+        instruction=instruction,
+        max_depth=max_depth,
+        max_breadth=max_breadth,
+        limit=limit,
+        seeds=seeds,
+    ))
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Crawl websites and save as markdown files",
@@ -165,14 +371,24 @@ Examples:
 
   # Control crawl depth and breadth
   python crawl_url.py https://nextjs.org/docs --depth 3 --limit 100
+
+  # Crawl several sections concurrently from a seed list (one URL per line)
+  python crawl_url.py --seeds seeds.txt -o ./docs
         """
     )
 
     parser.add_argument(
         "url",
+        nargs="?",
         help="URL to crawl (e.g., https://docs.example.com)"
     )
 
+    parser.add_argument(
+        "--seeds",
+        type=Path,
+        help="File of start URLs, one per line, crawled concurrently and merged"
+    )
+
     parser.add_argument(
         "--instruction", "-i",
         help="Natural language guidance for the crawler (e.g., 'Focus on API endpoints')"
@@ -202,17 +418,31 @@ Examples:
         "--limit", "-l",
         type=int,
         default=50,
-        help="Max total pages (default: 50)"
+        help="Max total pages per start URL (default: 50)"
     )
 
     args = parser.parse_args()
 
+    seeds = []
+    if args.seeds:
+        try:
+            seed_lines = args.seeds.read_text(encoding="utf-8").splitlines()
+        except (OSError, UnicodeDecodeError) as e:
+            parser.error(f"cannot read seeds file {args.seeds}: {e}")
+        seeds = [
+            line.strip()
+            for line in seed_lines
+            if line.strip() and not line.strip().startswith("#")
+        ]
+    if not args.url and not seeds:
+        parser.error("a URL or --seeds file is required")
+
     # Determine output directory
     if args.output:
         output_dir = args.output
     else:
         # Default: <repo_root>/crawled_context/<domain>
-        parsed = urlparse(args.url)
+        parsed = urlparse(args.url or seeds[0])
         domain = parsed.netloc.replace(".", "_")
         output_dir = CRAWLED_CONTEXT_DIR / domain
 
@@ -225,13 +455,15 @@ Examples:
             max_depth=args.depth,
             max_breadth=args.breadth,
             limit=args.limit,
+            seeds=seeds,
         )
 
         print(f"\n{'='*60}")
         print("✨ Crawl complete!")
         print(f"{'='*60}")
         print(f"📁 Output: {result['output_dir']}")
-        print(f"📄 Files: {result['pages_saved']}")
+        print(f"📄 Files: {result['pages_saved'] + result['pages_unchanged']} "
+              f"({result['pages_saved']} saved, {result['pages_unchanged']} unchanged)")
 
     except Exception as e:
         print(f"\n❌ Error: {e}")
@@ -23,68 +23,216 @@ Usage:
 
     # Fast search with more results
     python deal_hunt.py "Dyson V15" --max-results 15 --search-depth fast
+
+    # Bypass the on-disk result cache
+    python deal_hunt.py "PS5" --no-cache
 """
 
 import argparse
 import asyncio
+import hashlib
+import heapq
 import json
 import os
+import random
 import sys
+import tempfile
+import time
+import weakref
 from datetime import datetime, timezone
+from pathlib import Path
 
 try:
     from tavily import AsyncTavilyClient
+    from tavily.errors import UsageLimitExceededError
 except ImportError:
     print("Error: tavily-python not installed. Run: pip install tavily-python")
     sys.exit(1)
 
+# Optional fast JSON serializer for CLI output
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-async def search(client, query, domains, max_results, time_range, search_depth):
-    """Execute a single Tavily search."""
-    kwargs = {
-        "query": query,
-        "max_results": max_results,
-        "search_depth": search_depth,
-    }
-    if time_range:
-        kwargs["time_range"] = time_range
-    if domains:
-        kwargs["include_domains"] = domains
+# Per-user cache directory (never the shared temp dir, where other local
+# users could plant results)
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "tavily-plugin"
+
+# How long cached results stay fresh (seconds), by time_range
+CACHE_TTL = {
+    "day": 60 * 60,
+    "week": 6 * 60 * 60,
+    "month": 24 * 60 * 60,
+    "year": 24 * 60 * 60,
+}
+DEFAULT_CACHE_TTL = 60 * 60
+
+# Max searches in flight at once across all deal_hunt calls on an event loop,
+# and retries when Tavily rate-limits (HTTP 429)
+MAX_CONCURRENT_SEARCHES = 8
+RATE_LIMIT_RETRIES = 3
 
-    response = await client.search(**kwargs)
-    return response.get("results", [])
+# Search semaphores keyed by event loop; created lazily so none is ever bound
+# to a loop other than the one using it, and dropped when that loop goes away
+_search_limiters = weakref.WeakKeyDictionary()
 
 
-def deduplicate_by_url(all_results):
+def _search_limiter():
+    """Return the search semaphore shared by every deal_hunt call on the running loop."""
+    loop = asyncio.get_running_loop()
+    limiter = _search_limiters.get(loop)
+    if limiter is None:
+        limiter = _search_limiters[loop] = asyncio.Semaphore(MAX_CONCURRENT_SEARCHES)
+    return limiter
+
+
+def _is_rate_limited(error):
+    """Return True if error is a Tavily rate-limit (HTTP 429) response."""
+    if isinstance(error, UsageLimitExceededError):
+        return True
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None) == 429
+
+
+async def search(client, semaphore, query, search_kwargs):
+    """
+    Execute a single Tavily search, backing off and retrying when rate-limited.
+
+    search_kwargs holds the parameters shared by every query in a hunt.
+    """
+    for attempt in range(RATE_LIMIT_RETRIES + 1):
+        try:
+            async with semaphore:
+                response = await client.search(query=query, **search_kwargs)
+            return response.get("results", [])
+        except Exception as e:
+            if attempt == RATE_LIMIT_RETRIES or not _is_rate_limited(e):
+                raise
+        # Sleep outside the semaphore so other searches can proceed
+        await asyncio.sleep(2 ** attempt + random.random())
+
+
+def _merge_into(url_data, result, order):
+    """
+    Merge a single result into url_data, keeping highest score and merging content.
+
+    order is a (query index, position) tuple. Results may arrive in any order,
+    but the merged output matches merging them in query order.
+    """
+    url = result.get("url")
+    if not url:
+        return
+
+    score = result.get("score", 0)
+    content = result.get("content", "")
+
+    if url not in url_data:
+        # First sighting: store the result as-is and defer chunk bookkeeping
+        # until the URL repeats, so queries with no overlapping URLs never pay
+        # for it
+        url_data[url] = {"result": result, "order": order, "chunks": None}
+        return
+
+    entry = url_data[url]
+    if entry["chunks"] is None:
+        # Copy on first merge so the caller's result dict is never mutated
+        entry["result"] = dict(entry["result"])
+        first_content = entry["result"].get("content", "")
+        # Seen chunks mapped to the earliest position they appeared at
+        entry["chunks"] = {first_content: entry["order"]} if first_content else {}
+
+    existing = entry["result"]
+    if order < entry["order"]:
+        # A result from an earlier query arrived late; it becomes the base
+        # result, keeping the higher score
+        base = dict(result)
+        if existing.get("score", 0) > score:
+            base["score"] = existing["score"]
+        entry["result"] = base
+        entry["order"] = order
+    elif score > existing.get("score", 0):
+        # Keep higher score
+        existing["score"] = score
+
+    # Merge content chunks, skipping ones already seen for this URL
+    chunks = entry["chunks"]
+    if content and (content not in chunks or order < chunks[content]):
+        chunks[content] = order
+
+
+def _sorted_by_score(url_data, limit=None):
+    """Return merged results sorted by score descending, capped at limit."""
+    entries = []
+    for entry in url_data.values():
+        if entry["chunks"]:
+            ordered_chunks = sorted(entry["chunks"], key=entry["chunks"].get)
+            entry["result"]["content"] = " [...] ".join(ordered_chunks)
+        entries.append(entry)
+    if limit is None:
+        limit = len(entries)
+    # Equal scores keep query order, as a stable sort over merged results would
+    top = heapq.nlargest(
+        limit,
+        entries,
+        key=lambda e: (e["result"].get("score", 0), -e["order"][0], -e["order"][1]),
+    )
+    return [entry["result"] for entry in top]
+
+
+def deduplicate_by_url(all_results, limit=None):
     """
     Deduplicate results by URL, keeping highest score and merging content.
+    Only the top `limit` results by score are returned (all when None).
     """
     url_data = {}
 
-    for result in all_results:
-        url = result.get("url")
-        if not url:
-            continue
+    for idx, result in enumerate(all_results):
+        _merge_into(url_data, result, (0, idx))
 
-        score = result.get("score", 0)
-        content = result.get("content", "")
+    return _sorted_by_score(url_data, limit)
 
-        if url in url_data:
-            existing = url_data[url]
-            # Keep higher score
-            if score > existing.get("score", 0):
-                existing["score"] = score
-            # Merge content chunks
-            existing_content = existing.get("content", "")
-            if content and content not in existing_content:
-                existing["content"] = existing_content + " [...] " + content
-        else:
-            url_data[url] = result.copy()
 
-    # Sort by score descending
-    results = list(url_data.values())
-    results.sort(key=lambda x: x.get("score", 0), reverse=True)
-    return results
+def _cache_path(product, search_queries, domains, max_results, time_range, search_depth):
+    """Return the cache file for a set of search parameters."""
+    key_data = json.dumps(
+        [product, search_queries, domains, max_results, time_range, search_depth],
+        sort_keys=True,
+    )
+    cache_key = hashlib.blake2b(key_data.encode(), digest_size=16).hexdigest()
+    return CACHE_DIR / f"deal_hunt_{cache_key}.json"
+
+
+def _load_cached(cache_path, ttl):
+    """Return the cached result if it exists and is younger than ttl, else None."""
+    try:
+        if time.time() - cache_path.stat().st_mtime < ttl:
+            return json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _save_cached(cache_path, result):
+    """Atomically write a result to the cache, ignoring filesystem errors."""
+    try:
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # mkstemp creates the file with 0o600 permissions
+        fd, tmp_name = tempfile.mkstemp(
+            dir=cache_path.parent, prefix=cache_path.name, suffix=".tmp"
+        )
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(json.dumps(result).encode("utf-8"))
+        os.replace(tmp_name, cache_path)
+    except OSError:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
 
 
 async def deal_hunt(
@@ -95,6 +243,7 @@ async def deal_hunt(
     max_results=10,
     time_range="week",
     search_depth="advanced",
+    use_cache=True,
 ):
     """
     Search for deals on a product.
@@ -107,6 +256,7 @@ async def deal_hunt(
         max_results: Max results per query
         time_range: day, week, month, year, or None
         search_depth: basic, advanced, fast, ultrafast
+        use_cache: Reuse recent results for identical parameters (TTL by time_range)
 
     Returns raw Tavily results for Claude to analyze.
     """
@@ -114,8 +264,6 @@ async def deal_hunt(
     if not api_key:
         raise ValueError("TAVILY_API_KEY not set")
 
-    client = AsyncTavilyClient(api_key=api_key)
-
     # Determine queries to run
     if queries:
         # Multi-query mode (max 3)
@@ -127,25 +275,55 @@ async def deal_hunt(
         # Default query
         search_queries = [f"{product} deal price"]
 
-    # Run searches in parallel
-    tasks = [
-        search(client, q, domains, max_results, time_range, search_depth)
-        for q in search_queries
-    ]
-    results_lists = await asyncio.gather(*tasks)
-
-    # Flatten and deduplicate
-    all_results = []
-    for results in results_lists:
-        all_results.extend(results)
-
-    if len(search_queries) > 1:
-        # Deduplicate when multiple queries
-        final_results = deduplicate_by_url(all_results)
-    else:
-        final_results = all_results
+    cache_path = _cache_path(
+        product, search_queries, domains, max_results, time_range, search_depth
+    )
+    if use_cache:
+        cached = _load_cached(cache_path, CACHE_TTL.get(time_range, DEFAULT_CACHE_TTL))
+        if cached is not None:
+            return cached
 
-    return {
+    # Parameters shared by every query
+    search_kwargs = {
+        "max_results": max_results,
+        "search_depth": search_depth,
+    }
+    if time_range:
+        search_kwargs["time_range"] = time_range
+    if domains:
+        search_kwargs["include_domains"] = domains
+
+    # Run searches in parallel, bounded by a limiter shared with any other
+    # deal_hunt calls on this loop to avoid tripping rate limits. The client's
+    # connection pool is scoped to this call (and so to one event loop) and
+    # closed when the searches finish.
+    semaphore = _search_limiter()
+    async with AsyncTavilyClient(api_key=api_key) as client:
+        async def indexed_search(query_idx, q):
+            return query_idx, await search(client, semaphore, q, search_kwargs)
+
+        tasks = [
+            asyncio.create_task(indexed_search(i, q))
+            for i, q in enumerate(search_queries)
+        ]
+        try:
+            if len(search_queries) > 1:
+                # Deduplicate when multiple queries, merging each result set as it arrives
+                url_data = {}
+                for next_results in asyncio.as_completed(tasks):
+                    query_idx, results = await next_results
+                    for pos, result in enumerate(results):
+                        _merge_into(url_data, result, (query_idx, pos))
+                final_results = _sorted_by_score(url_data, max_results * len(search_queries))
+            else:
+                _, final_results = await tasks[0]
+        finally:
+            # If a search failed, stop the rest before the client is closed
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    result = {
         "meta": {
             "product": product,
             "queries": search_queries,
@@ -157,6 +335,24 @@ async def deal_hunt(
         "results": final_results,
     }
 
+    if use_cache:
+        _save_cached(cache_path, result)
+
+    return result
+
+
+def _print_json(obj):
+    """Print obj as indented JSON, using orjson when available."""
+    # stdout may be replaced (e.g. captured) by an object with no binary buffer
+    buffer = getattr(sys.stdout, "buffer", None)
+    if orjson is not None and buffer is not None:
+        # Write bytes straight to the binary buffer, skipping the text encode
+        sys.stdout.flush()
+        buffer.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2) + b"\n")
+    else:
+        # ensure_ascii=False matches orjson's raw UTF-8 output
+        print(json.dumps(obj, indent=2, ensure_ascii=False))
+
 
 def main():
     parser = argparse.ArgumentParser(description="Search for deals")
@@ -169,6 +365,8 @@ def main():
                         choices=["day", "week", "month", "year", "none"])
     parser.add_argument("--search-depth", "-s", default="advanced",
                         choices=["basic", "advanced", "fast", "ultrafast"])
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Ignore and don't update the on-disk result cache")
 
     args = parser.parse_args()
 
@@ -191,8 +389,9 @@ def main():
             max_results=args.max_results,
             time_range=time_range,
             search_depth=args.search_depth,
+            use_cache=not args.no_cache,
         ))
-        print(json.dumps(result, indent=2))
+        _print_json(result)
 
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)